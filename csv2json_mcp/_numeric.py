@@ -0,0 +1,296 @@
+"""纯数值 CSV 的快速解析路径（numpy 与 numba 为可选依赖）."""
+
+import mmap
+import re
+from functools import lru_cache
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:  # 未安装 numpy 时只提供纯 Python 实现
+    np = None
+
+
+# 快速路径支持的数值格式：可选负号、整数部分、可选小数部分
+NUMERIC_RE = re.compile(r"^-?\d+(\.\d+)?$")
+
+# 整列检查：列内单元格以 \n 拼接后只需一次正则匹配
+_COLUMN_RE = re.compile(r"(?:-?\d+(?:\.\d+)?\n)*-?\d+(?:\.\d+)?")
+
+# 整数列：不超过 18 位，保证能以 64 位整数序列化
+_INT_COLUMN_RE = re.compile(r"(?:-?\d{1,18}\n)*-?\d{1,18}")
+
+# 全部为整数但位数更多的列（如 ID），转为 float 会丢失精度
+_LONG_INT_COLUMN_RE = re.compile(r"(?:-?\d+\n)*-?\d+")
+
+# 浮点数列的输出精度：f64 保持原值，f32 / bf16-as-f32 先降低精度再以 float32 的最短表示输出
+NUMERIC_PRECISIONS = ("f64", "f32", "bf16-as-f32")
+
+# 触发快速路径前抽样检查的数据行数
+SAMPLE_ROWS = 100
+
+
+def transpose_rows(rows: List[List[str]]) -> List[List[str]]:
+    """将行优先的数据转置为列优先（由 zip 在 C 层完成），要求各行列数相同."""
+    return list(map(list, zip(*rows)))
+
+
+def _match_column(column: List[str], pattern: "re.Pattern[str]") -> bool:
+    """整列匹配；换行符个数用于排除单元格内自带换行的情况."""
+    joined = "\n".join(column)
+    return (
+        joined.count("\n") == len(column) - 1
+        and pattern.fullmatch(joined) is not None
+    )
+
+
+def is_numeric_rows(rows: List[List[str]]) -> bool:
+    """判断所有单元格是否都是快速路径支持的数值格式."""
+    if rows and rows[0] and all(len(row) == len(rows[0]) for row in rows):
+        # 列数一致时按列检查，每列一次正则匹配
+        return all(_match_column(column, _COLUMN_RE) for column in transpose_rows(rows))
+    fullmatch = NUMERIC_RE.fullmatch
+    return all(fullmatch(cell) for row in rows for cell in row)
+
+
+def to_precision(values, precision: str):
+    """
+    将 float64 数组转换为目标精度。
+
+    bf16-as-f32 先按就近舍入（ties to even）截断为 bfloat16 的 8 位有效位，
+    再以 float32 表示。有值超出 float32 范围时返回原 float64 数组，
+    避免输出无法表示为 JSON 的 inf。
+    """
+    if precision == "f64":
+        return values
+    if np is None:
+        raise ValueError(f"numeric_precision={precision!r} 需要安装 numpy")
+    original = np.asarray(values, dtype=np.float64)
+    with np.errstate(over="ignore"):
+        values = original.astype(np.float32)
+    if precision == "bf16-as-f32":
+        bits = values.view(np.uint32)
+        bits = (bits + np.uint32(0x7FFF) + ((bits >> 16) & np.uint32(1))) & np.uint32(0xFFFF0000)
+        values = bits.view(np.float32)
+    if np.isinf(values).any():
+        return original
+    return values
+
+
+def _float_list(values, precision: str, numpy_scalars: bool) -> list:
+    """
+    将浮点数据转换为可序列化的列表。
+
+    numpy_scalars 为 True 时保留 numpy.float32 标量，由 orjson 直接输出最短表示；
+    否则转换为十进制表示相同的 Python float，标准库 json 也能输出同样简短的结果。
+    """
+    if precision == "f64":
+        if np is not None and isinstance(values, np.ndarray):
+            return values.tolist()
+        return list(map(float, values))
+    values = to_precision(values, precision)
+    if values.dtype == np.float64:
+        # 超出 float32 范围，保持 f64
+        return values.tolist()
+    if numpy_scalars:
+        return list(values)
+    return [float(str(value)) for value in values]
+
+
+def _convert_column(column: List[str], precision: str, numpy_scalars: bool) -> list:
+    """按列类型转换：整数列为 int，数值列为 float，其余保持字符串."""
+    if _match_column(column, _INT_COLUMN_RE):
+        return list(map(int, column))
+    if _match_column(column, _LONG_INT_COLUMN_RE):
+        # 超过 18 位的整数列保持字符串，避免 ID 等被转换为有损的 float
+        return column
+    if _match_column(column, _COLUMN_RE):
+        return _float_list(column, precision, numpy_scalars)
+    return column
+
+
+def convert_numeric_columns(
+    rows: List[List[str]],
+    precision: str = "f64",
+    numpy_scalars: bool = False
+) -> List[list]:
+    """
+    按列推断类型并转换数值列。
+
+    Args:
+        rows: 数据行列表
+        precision: 浮点数列的输出精度
+        numpy_scalars: 是否保留 numpy 标量（仅 orjson 可序列化）
+
+    Returns:
+        转换后的数据行
+    """
+    if not rows:
+        return rows
+    width = len(rows[0])
+    if width and all(len(row) == width for row in rows):
+        columns = transpose_rows(rows)
+        converted = [_convert_column(col, precision, numpy_scalars) for col in columns]
+        return list(map(list, zip(*converted)))
+
+    # 列数不一致时，每列只包含实际存在的单元格
+    columns = [
+        [row[j] for row in rows if len(row) > j]
+        for j in range(max(map(len, rows)))
+    ]
+    iters = [
+        iter(_convert_column(col, precision, numpy_scalars)) for col in columns
+    ]
+    return [[next(iters[j]) for j in range(len(row))] for row in rows]
+
+
+def array_to_columns(
+    data,
+    int_columns,
+    precision: str,
+    numpy_scalars: bool
+) -> List[list]:
+    """将快速路径解析出的 float64 数组按列转换为 int / float 列表."""
+    return [
+        data[:, j].astype(np.int64).tolist() if int_columns[j]
+        else _float_list(data[:, j], precision, numpy_scalars)
+        for j in range(data.shape[1])
+    ]
+
+
+@lru_cache(maxsize=None)
+def load_kernels():
+    """
+    首次调用时导入 numba 并定义解析内核。
+
+    numba 的导入开销较大，只在真正需要快速路径时才导入。
+
+    Returns:
+        (_count_rows, _parse_numeric)；未安装 numpy / numba 时返回 None
+    """
+    if np is None:
+        return None
+    try:
+        from numba import njit
+    except ImportError:
+        return None
+
+    @njit(cache=True)
+    def _count_rows(buf, start):
+        """统计 start 之后的行数，末行没有换行符时也计入."""
+        n = buf.shape[0]
+        count = 0
+        for i in range(start, n):
+            if buf[i] == 10:
+                count += 1
+        if n > start and buf[n - 1] != 10:
+            count += 1
+        return count
+
+    @njit(cache=True)
+    def _parse_numeric(buf, start, delim, out, int_columns):
+        """
+        从 start 开始解析数值并写入 out，成功时返回解析的行数，否则返回 -1。
+
+        仅接受 NUMERIC_RE 描述的格式，并要求每行列数与 out 一致。
+        有效数字超过 15 位时放弃解析，以保证结果与 float() 完全一致。
+        出现小数部分的列在 int_columns 中标记为 False。
+        """
+        n = buf.shape[0]
+        nrows, ncols = out.shape
+        pos = start
+        r = 0
+        while pos < n and r < nrows:
+            c = 0
+            while True:
+                neg = False
+                if pos < n and buf[pos] == 45:
+                    neg = True
+                    pos += 1
+                mantissa = 0
+                ndigits = 0
+                while pos < n and buf[pos] >= 48 and buf[pos] <= 57:
+                    mantissa = mantissa * 10 + (buf[pos] - 48)
+                    ndigits += 1
+                    pos += 1
+                if ndigits == 0:
+                    return -1
+                frac = 0
+                if pos < n and buf[pos] == 46:
+                    pos += 1
+                    while pos < n and buf[pos] >= 48 and buf[pos] <= 57:
+                        mantissa = mantissa * 10 + (buf[pos] - 48)
+                        frac += 1
+                        pos += 1
+                    if frac == 0:
+                        return -1
+                    int_columns[c] = False
+                if ndigits + frac > 15 or c >= ncols:
+                    return -1
+                value = mantissa / 10.0 ** frac
+                out[r, c] = -value if neg else value
+                c += 1
+                if pos >= n:
+                    break
+                b = buf[pos]
+                if b == delim:
+                    pos += 1
+                    continue
+                if b == 13:
+                    pos += 1
+                    if pos < n and buf[pos] == 10:
+                        pos += 1
+                    break
+                if b == 10:
+                    pos += 1
+                    break
+                return -1
+            if c != ncols:
+                return -1
+            r += 1
+        if pos < n or r != nrows:
+            return -1
+        return r
+
+    return _count_rows, _parse_numeric
+
+
+def parse_numeric_file(path, data_start: int, column_count: int, delimiter: str):
+    """
+    使用 numba 内核解析纯数值 CSV 文件。
+
+    Args:
+        path: CSV 文件路径
+        data_start: 第一行数据在文件中的字节偏移
+        column_count: 列数
+        delimiter: 单字节 CSV 分隔符
+
+    Returns:
+        (形状为 (行数, 列数) 的 float64 数组, 每列是否全部为整数的布尔数组)；
+        依赖缺失或内容不符合快速路径要求时返回 None
+    """
+    if len(delimiter.encode("ascii", "ignore")) != 1 or column_count == 0:
+        return None
+    kernels = load_kernels()
+    if kernels is None:
+        return None
+    count_rows, parse_numeric = kernels
+
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # 空文件无法映射
+            return None
+        with mm:
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            try:
+                rows = count_rows(buf, data_start)
+                out = np.empty((rows, column_count), dtype=np.float64)
+                int_columns = np.ones(column_count, dtype=np.bool_)
+                if parse_numeric(buf, data_start, ord(delimiter), out, int_columns) < 0:
+                    return None
+            finally:
+                # 释放对 mmap 的引用，否则无法关闭
+                del buf
+    return out, int_columns
@@ -1,22 +1,192 @@
 """CSV to JSON 转换器模块（使用标准库实现）."""
 
+import codecs
 import csv
 import json
+import os
+import shutil
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Union
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from io import StringIO
-from pydantic import BaseModel, Field
 
+from . import _numeric
 
-class CSVConversionOptions(BaseModel):
+try:
+    from . import _csv_fast
+except ImportError:  # 未编译 C 扩展时使用 csv 模块解析
+    _csv_fast = None
+
+try:
+    import orjson
+except ImportError:  # 未安装 orjson 时退回标准库 json
+    orjson = None
+
+
+# 支持的 JSON 输出格式
+SUPPORTED_ORIENTS = ("records", "values", "split")
+
+
+# C 扩展每次调用返回的最大行数
+CSV_FAST_BATCH_ROWS = 64
+
+
+def _can_use_csv_fast(options: "CSVConversionOptions") -> bool:
+    """判断能否使用 C 扩展解析：扩展已编译、UTF-8 编码且分隔符为单个 ASCII 字符."""
+    return (
+        _csv_fast is not None
+        and codecs.lookup(options.encoding).name == "utf-8"
+        and len(options.delimiter) == 1
+        and options.delimiter.isascii()
+        and options.delimiter not in '"\r\n'
+    )
+
+
+def _iter_csv_fast_rows(fp: BinaryIO, delimiter: str) -> Iterator[List[str]]:
+    """
+    以 1 MiB 块读取二进制文件并用 C 扩展解析，逐行返回。
+    
+    每次调用最多取回 CSV_FAST_BATCH_ROWS 行，避免一次性创建大量行列表而
+    反复触发分代 GC。块末尾不完整的记录与下一块拼接后再解析；记录跨越多块时
+    读取量随之倍增，避免对同一记录反复从头解析。
+    """
+    parse = _csv_fast.parse
+    delim = ord(delimiter)
+    field_limit = csv.field_size_limit()
+    buf = b""
+    pos = 0
+    final = False
+    while True:
+        rows, pos = parse(buf, delim, final, pos, CSV_FAST_BATCH_ROWS, field_limit)
+        if rows:
+            yield from rows
+            continue
+        if final:
+            return
+        pending = buf[pos:]
+        chunk = fp.read(max(1 << 20, len(pending)))
+        final = not chunk
+        buf = pending + chunk if pending else chunk
+        pos = 0
+
+
+@contextmanager
+def _open_output_atomic(path: Path) -> Iterator[BinaryIO]:
+    """
+    以二进制模式打开输出文件，写入同目录下的临时文件，成功后再替换目标文件。
+    
+    转换中途出错时删除临时文件，已存在的输出文件保持不变。
+    符号链接先解析为实际文件，替换的是链接指向的文件而不是链接本身；
+    已存在的文件保留原权限位，但属主与 ACL 会变为新文件的；
+    新建文件的权限与直接 open() 一样受 umask 控制。
+    
+    Raises:
+        ValueError: 无法创建或替换输出文件，错误信息中是目标路径而不是临时文件
+    """
+    target = Path(os.path.realpath(path))
+    tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        f = open(tmp_path, 'xb')
+    except OSError as e:
+        raise ValueError(f"无法写入输出文件 {str(path)!r}: {e.strerror}") from e
+    try:
+        with f:
+            yield f
+        if target.exists():
+            shutil.copymode(target, tmp_path)
+        try:
+            os.replace(tmp_path, target)
+        except OSError as e:
+            raise ValueError(f"无法写入输出文件 {str(path)!r}: {e.strerror}") from e
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+# 列数不超过该值时使用按表头生成的 records 构造函数，更宽的表 dict(zip(...)) 更快
+CODEGEN_MAX_COLUMNS = 16
+
+
+@lru_cache(maxsize=128)
+def _compile_record_builder(headers: Tuple[str, ...]) -> Callable[[List[str]], Dict[str, str]]:
+    """
+    为固定表头生成形如 ``lambda r: {"a": r[0], "b": r[1]}`` 的构造函数。
+    
+    常量键的字典字面量编译为单条 BUILD_MAP 指令，省去 zip 迭代器的创建与遍历。
+    键通过 repr 嵌入源码，任意表头字符串都是合法的字面量。
+    """
+    items = ", ".join(f"{name!r}: r[{i}]" for i, name in enumerate(headers))
+    namespace: Dict[str, Any] = {}
+    exec(f"def _build(r):\n    return {{{items}}}", namespace)
+    return namespace["_build"]
+
+
+# 自动检测时考虑的分隔符，出现次数相同时靠前者优先
+DELIMITER_CANDIDATES = b",;\t|"
+
+
+def _sniff_delimiter(sample: bytes) -> str:
+    """
+    根据字节出现次数检测 CSV 分隔符。
+    
+    每个候选字符只需一次 bytes.count（C 层扫描），比 csv.Sniffer 的正则匹配快得多。
+    样本中没有任何候选字符时返回逗号。
+    """
+    return chr(max(DELIMITER_CANDIDATES, key=sample.count))
+
+
+def _uses_orjson(indent: Optional[int]) -> bool:
+    """
+    判断给定缩进能否走 orjson 快速路径。
+    
+    orjson 只支持紧凑格式和 2 空格缩进；其他缩进由标准库 json 在 Python 层
+    递归插入空白，明显更慢，面向程序消费的场景应使用 None。
+    """
+    return orjson is not None and indent in (None, 2)
+
+
+def _dumps_json_bytes(result: Any, indent: Optional[int]) -> bytes:
+    """将 Python 对象序列化为 UTF-8 编码的 JSON 字节串."""
+    if _uses_orjson(indent):
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent == 2:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(result, option=option)
+    return json.dumps(result, ensure_ascii=False, indent=indent).encode('utf-8')
+
+
+def _dumps_json(result: Any, indent: Optional[int]) -> str:
+    """将 Python 对象序列化为 JSON 字符串."""
+    if _uses_orjson(indent):
+        return _dumps_json_bytes(result, indent).decode('utf-8')
+    return json.dumps(result, ensure_ascii=False, indent=indent)
+
+
+@dataclass(slots=True, frozen=True)
+class CSVConversionOptions:
     """CSV 转换选项."""
     
-    delimiter: str = Field(default=",", description="CSV 分隔符")
-    encoding: str = Field(default="utf-8", description="文件编码")
-    skip_rows: int = Field(default=0, description="跳过的行数")
-    header: bool = Field(default=True, description="是否包含表头")
-    orient: str = Field(default="records", description="JSON 输出格式: 'records', 'values', 'split'")
-    indent: Optional[int] = Field(default=None, description="JSON 缩进，None 表示压缩格式")
+    delimiter: str = ","  # CSV 分隔符
+    encoding: str = "utf-8"  # 文件编码
+    skip_rows: int = 0  # 跳过的行数
+    header: bool = True  # 是否包含表头
+    orient: str = "records"  # JSON 输出格式: 'records', 'values', 'split'
+    indent: Optional[int] = None  # JSON 缩进，None 表示压缩格式；仅 None 和 2 走 orjson 快速路径
+    parse_numbers: bool = False  # 数值列按数字输出：整数列为 int，其余数值列为 float
+    numeric_precision: str = "f64"  # 浮点数列精度: 'f64', 'f32', 'bf16-as-f32'
+    
+    def __post_init__(self):
+        if self.orient not in SUPPORTED_ORIENTS:
+            raise ValueError(f"不支持的 JSON 格式: {self.orient}")
+        if self.numeric_precision not in _numeric.NUMERIC_PRECISIONS:
+            raise ValueError(f"不支持的数值精度: {self.numeric_precision}")
 
 
 class CSVConverter:
@@ -24,109 +194,300 @@ class CSVConverter:
     
     def __init__(self):
         # 简化支持的格式，移除 pandas 特有的格式
-        self.supported_formats = ["records", "values", "split"]
+        self.supported_formats = list(SUPPORTED_ORIENTS)
     
+    @contextmanager
     def _read_csv_data(
         self,
         csv_source: Union[str, Path, StringIO],
         options: CSVConversionOptions
-    ) -> tuple[List[str], List[List[str]]]:
+    ) -> Iterator[Tuple[List[str], Iterator[List[str]]]]:
         """
-        读取 CSV 数据并返回列名和数据行。
+        读取 CSV 数据并返回列名和数据行迭代器。
+        
+        数据行是惰性读取的，文件在上下文退出时才会关闭，
+        因此必须在 with 块内消费完数据行。
         
         Args:
             csv_source: CSV 数据源（文件路径或字符串）
             options: 转换选项
             
-        Returns:
-            (列名列表, 数据行列表)
+        Yields:
+            (列名列表, 数据行迭代器)
         """
         # 处理文件路径和字符串输入
-        if isinstance(csv_source, (str, Path)):
-            with open(csv_source, 'r', encoding=options.encoding) as f:
+        if isinstance(csv_source, (str, Path)) and _can_use_csv_fast(options):
+            # C 扩展直接解析 UTF-8 字节
+            with open(csv_source, 'rb') as f:
+                reader = _iter_csv_fast_rows(f, options.delimiter)
+                yield self._process_csv_reader(reader, options)
+        elif isinstance(csv_source, (str, Path)):
+            # TextIOWrapper 按大块解码且带 ASCII 快速路径，改为二进制读取后逐行
+            # bytes.decode（包括 mmap 按行读取）并不会更快，因此直接使用文本模式
+            with open(csv_source, 'r', encoding=options.encoding, newline='') as f:
                 reader = csv.reader(f, delimiter=options.delimiter)
-                return self._process_csv_reader(reader, options)
+                yield self._process_csv_reader(reader, options)
         else:
             # 处理字符串输入
             reader = csv.reader(csv_source, delimiter=options.delimiter)
-            return self._process_csv_reader(reader, options)
+            yield self._process_csv_reader(reader, options)
     
     def _process_csv_reader(
         self,
-        reader: csv.reader,
+        reader: Iterator[List[str]],
         options: CSVConversionOptions
-    ) -> tuple[List[str], List[List[str]]]:
+    ) -> Tuple[List[str], Iterator[List[str]]]:
         """
-        处理 CSV 读取器并返回列名和数据。
+        处理 CSV 读取器并返回列名和数据行迭代器。
         
         Args:
             reader: CSV 读取器
             options: 转换选项
             
         Returns:
-            (列名列表, 数据行列表)
+            (列名列表, 数据行迭代器)
         """
-        rows = list(reader)
-        
         # 跳过指定行数
-        if options.skip_rows > 0:
-            rows = rows[options.skip_rows:]
+        for _ in range(options.skip_rows):
+            next(reader, None)
         
-        if not rows:
-            return [], []
+        first_row = next(reader, None)
+        if first_row is None:
+            return [], iter(())
         
         # 处理表头
         if options.header:
-            headers = rows[0]
-            data_rows = rows[1:]
+            headers = first_row
+            data_rows = reader
         else:
-            # 如果没有表头，生成默认列名
-            headers = [f"column_{i}" for i in range(len(rows[0]))]
-            data_rows = rows
+            # 如果没有表头，根据首行生成默认列名，首行仍作为数据
+            headers = [f"column_{i}" for i in range(len(first_row))]
+            data_rows = chain((first_row,), reader)
         
         return headers, data_rows
     
-    def _convert_to_json_format(
+    def _numeric_fast_path(
+        self,
+        csv_path: Path,
+        options: CSVConversionOptions
+    ) -> Optional[Any]:
+        """
+        对纯数值 CSV 文件尝试 numba 快速解析路径。
+        
+        先抽样检查前若干行是否全部为数值，再由 numba 内核直接解析内存映射的文件，
+        没有小数部分的列按整数输出。
+        
+        Args:
+            csv_path: CSV 文件路径
+            options: 转换选项
+            
+        Returns:
+            可直接序列化为 JSON 的 Python 对象；不满足快速路径条件时返回 None
+        """
+        if not options.parse_numbers or _numeric.load_kernels() is None:
+            return None
+        # 内核按字节扫描，仅支持 ASCII 兼容且无 BOM 的编码
+        if codecs.lookup(options.encoding).name not in ("utf-8", "ascii"):
+            return None
+        
+        with open(csv_path, 'rb') as f:
+            prefix = [f.readline() for _ in range(options.skip_rows)]
+            header_line = f.readline() if options.header else b""
+            if options.header and not header_line:
+                return None
+            data_start = f.tell()
+            sample_lines = [f.readline() for _ in range(_numeric.SAMPLE_ROWS)]
+        
+        # 跳过的行和表头按物理行读取，只有不含引号和单独的 \r 时才与 CSV 记录一一对应
+        prefix = b"".join(prefix) + header_line
+        if b'"' in prefix or b"\r" in prefix.replace(b"\r\n", b""):
+            return None
+        
+        try:
+            headers = None
+            if options.header:
+                headers = next(csv.reader(
+                    [header_line.decode(options.encoding)], delimiter=options.delimiter
+                ))
+            sample = list(csv.reader(
+                [line.decode(options.encoding) for line in sample_lines if line],
+                delimiter=options.delimiter
+            ))
+        except (csv.Error, UnicodeDecodeError):
+            # 交给标准路径处理（或报告错误）
+            return None
+        if not sample or not _numeric.is_numeric_rows(sample):
+            return None
+        if headers is None:
+            headers = [f"column_{i}" for i in range(len(sample[0]))]
+        
+        parsed = _numeric.parse_numeric_file(
+            csv_path, data_start, len(headers), options.delimiter
+        )
+        if parsed is None:
+            return None
+        data, int_columns = parsed
+        numpy_scalars = _uses_orjson(options.indent)
+        
+        if options.orient != "records" and numpy_scalars and (
+            int_columns.all() or not int_columns.any()
+        ):
+            # 各列类型一致时，numpy 数组直接交给 orjson 序列化
+            if int_columns.all():
+                data = data.astype(_numeric.np.int64)
+            else:
+                data = _numeric.to_precision(data, options.numeric_precision)
+        else:
+            columns = _numeric.array_to_columns(
+                data, int_columns, options.numeric_precision, numpy_scalars
+            )
+            if options.orient == "records":
+                hdrs = tuple(headers)
+                return [dict(zip(hdrs, row)) for row in zip(*columns)]
+            data = list(map(list, zip(*columns)))
+        
+        if options.orient == "values":
+            return data
+        return {"columns": headers, "data": data}
+    
+    def _build_json_result(
         self,
         headers: List[str],
-        data_rows: List[List[str]],
+        data_rows: Iterable[List[str]],
         options: CSVConversionOptions
-    ) -> str:
+    ) -> Any:
         """
-        将 CSV 数据转换为指定格式的 JSON。
+        将 CSV 数据组织为指定格式的 Python 对象。
         
         Args:
             headers: 列名列表
-            data_rows: 数据行列表
+            data_rows: 数据行（可为惰性迭代器）
             options: 转换选项
             
         Returns:
-            JSON 格式的字符串
+            可直接序列化为 JSON 的 Python 对象
         """
+        if options.parse_numbers:
+            if options.orient == "records":
+                # records 会丢弃列数不匹配的行，类型只按保留下来的行推断
+                hlen = len(headers)
+                data_rows = [row for row in data_rows if len(row) == hlen]
+            data_rows = _numeric.convert_numeric_columns(
+                list(data_rows), options.numeric_precision, _uses_orjson(options.indent)
+            )
+        
         if options.orient == "records":
-            # 每行作为一个字典对象
-            result = []
-            for row in data_rows:
-                if len(row) == len(headers):
-                    record = {headers[i]: row[i] for i in range(len(headers))}
-                    result.append(record)
+            # 每行作为一个字典对象，列数不匹配的行被丢弃
+            # 内置函数绑定为局部变量，减少每行的全局查找
+            _dict, _zip, _len = dict, zip, len
+            hdrs = tuple(headers)
+            hlen = len(hdrs)
+            if hlen <= CODEGEN_MAX_COLUMNS:
+                build = _compile_record_builder(hdrs)
+                result = [build(row) for row in data_rows if _len(row) == hlen]
+            else:
+                result = [_dict(_zip(hdrs, row)) for row in data_rows if _len(row) == hlen]
             
         elif options.orient == "values":
             # 仅包含值的二维数组
-            result = data_rows
+            result = list(data_rows)
             
         elif options.orient == "split":
             # 分开存储列名和数据
             result = {
                 "columns": headers,
-                "data": data_rows
+                "data": list(data_rows)
             }
         
         else:
             raise ValueError(f"不支持的 JSON 格式: {options.orient}")
         
+        return result
+    
+    def _convert_to_json_format(
+        self,
+        headers: List[str],
+        data_rows: Iterable[List[str]],
+        options: CSVConversionOptions
+    ) -> str:
+        """
+        将 CSV 数据转换为指定格式的 JSON。
+        
+        Args:
+            headers: 列名列表
+            data_rows: 数据行（可为惰性迭代器）
+            options: 转换选项
+            
+        Returns:
+            JSON 格式的字符串
+        """
+        result = self._build_json_result(headers, data_rows, options)
+        
         # 转换为 JSON 字符串
-        return json.dumps(result, ensure_ascii=False, indent=options.indent)
+        return _dumps_json(result, options.indent)
+    
+    def _convert_to_json_bytes(
+        self,
+        headers: List[str],
+        data_rows: Iterable[List[str]],
+        options: CSVConversionOptions
+    ) -> bytes:
+        """
+        将 CSV 数据转换为 UTF-8 编码的 JSON 字节串，用于直接写入文件。
+        
+        Args:
+            headers: 列名列表
+            data_rows: 数据行（可为惰性迭代器）
+            options: 转换选项
+            
+        Returns:
+            JSON 字节串
+        """
+        result = self._build_json_result(headers, data_rows, options)
+        return _dumps_json_bytes(result, options.indent)
+    
+    def _stream_records_to_file(
+        self,
+        headers: List[str],
+        data_rows: Iterable[List[str]],
+        fp: BinaryIO
+    ) -> None:
+        """
+        逐行序列化 records 格式并写入二进制文件，内存占用与行数无关。
+        
+        输出与一次性序列化完整列表的紧凑格式结果一致。
+        
+        Args:
+            headers: 列名列表
+            data_rows: 数据行（可为惰性迭代器）
+            fp: 以二进制模式打开的输出文件
+        """
+        if orjson is not None:
+            dumps = orjson.dumps
+            separator = b","
+        else:
+            def dumps(record: Dict[str, str]) -> bytes:
+                return json.dumps(record, ensure_ascii=False).encode('utf-8')
+            separator = b", "
+        
+        hdrs = tuple(headers)
+        hlen = len(hdrs)
+        if hlen <= CODEGEN_MAX_COLUMNS:
+            build = _compile_record_builder(hdrs)
+        else:
+            def build(row: List[str]) -> Dict[str, str]:
+                return dict(zip(hdrs, row))
+        write = fp.write
+        write(b"[")
+        first = True
+        for row in data_rows:
+            if len(row) != hlen:
+                continue
+            if not first:
+                write(separator)
+            write(dumps(build(row)))
+            first = False
+        write(b"]")
     
     def convert_csv_to_json(
         self,
@@ -150,22 +511,21 @@ class CSVConverter:
         if options is None:
             options = CSVConversionOptions()
         
-        # 验证文件存在
+        # 文件不存在时由 open() 直接抛出 FileNotFoundError
         csv_path = Path(csv_file_path)
-        if not csv_path.exists():
-            raise FileNotFoundError(f"CSV 文件不存在: {csv_file_path}")
-        
-        # 验证 JSON 格式
-        if options.orient not in self.supported_formats:
-            raise ValueError(f"不支持的 JSON 格式: {options.orient}")
         
         try:
-            # 读取 CSV 数据
-            headers, data_rows = self._read_csv_data(csv_path, options)
+            # 纯数值文件优先走快速解析路径
+            result = self._numeric_fast_path(csv_path, options)
+            if result is not None:
+                return _dumps_json(result, options.indent)
             
-            # 转换为 JSON
-            return self._convert_to_json_format(headers, data_rows, options)
+            # 读取 CSV 数据并转换为 JSON
+            with self._read_csv_data(csv_path, options) as (headers, data_rows):
+                return self._convert_to_json_format(headers, data_rows, options)
             
+        except FileNotFoundError:
+            raise
         except csv.Error as e:
             raise ValueError(f"CSV 文件解析错误: {e}")
         except UnicodeDecodeError as e:
@@ -197,14 +557,8 @@ class CSVConverter:
         if options is None:
             options = CSVConversionOptions()
         
-        # 验证文件存在
+        # 文件不存在时由 open() 直接抛出 FileNotFoundError
         csv_path = Path(csv_file_path)
-        if not csv_path.exists():
-            raise FileNotFoundError(f"CSV 文件不存在: {csv_file_path}")
-        
-        # 验证 JSON 格式
-        if options.orient not in self.supported_formats:
-            raise ValueError(f"不支持的 JSON 格式: {options.orient}")
         
         # 生成输出文件路径
         if output_file_path is None:
@@ -214,18 +568,32 @@ class CSVConverter:
             output_file_path = Path(output_file_path)
         
         try:
-            # 读取 CSV 数据
-            headers, data_rows = self._read_csv_data(csv_path, options)
-            
-            # 转换为 JSON 对象
-            json_data = self._convert_to_json_format(headers, data_rows, options)
+            # 纯数值文件优先走快速解析路径
+            result = self._numeric_fast_path(csv_path, options)
+            if result is not None:
+                with _open_output_atomic(output_file_path) as f:
+                    f.write(_dumps_json_bytes(result, options.indent))
+                return str(output_file_path)
             
-            # 写入 JSON 文件
-            with open(output_file_path, 'w', encoding='utf-8') as f:
-                f.write(json_data)
+            with self._read_csv_data(csv_path, options) as (headers, data_rows):
+                if (
+                    options.orient == "records"
+                    and options.indent is None
+                    and not options.parse_numbers
+                ):
+                    # 逐行序列化写入，不在内存中保留完整的记录列表
+                    with _open_output_atomic(output_file_path) as f:
+                        self._stream_records_to_file(headers, data_rows, f)
+                else:
+                    # 直接写入 UTF-8 字节，避免 str 解码再编码的往返
+                    json_bytes = self._convert_to_json_bytes(headers, data_rows, options)
+                    with _open_output_atomic(output_file_path) as f:
+                        f.write(json_bytes)
             
             return str(output_file_path)
             
+        except FileNotFoundError:
+            raise
         except csv.Error as e:
             raise ValueError(f"CSV 文件解析错误: {e}")
         except UnicodeDecodeError as e:
@@ -254,10 +622,9 @@ class CSVConverter:
         try:
             # 从字符串读取 CSV 数据
             string_io = StringIO(csv_content)
-            headers, data_rows = self._read_csv_data(string_io, options)
-            
-            # 转换为 JSON
-            return self._convert_to_json_format(headers, data_rows, options)
+            with self._read_csv_data(string_io, options) as (headers, data_rows):
+                # 转换为 JSON
+                return self._convert_to_json_format(headers, data_rows, options)
             
         except csv.Error as e:
             raise ValueError(f"CSV 内容解析错误: {e}")
@@ -275,23 +642,45 @@ class CSVConverter:
             包含文件信息的字典
         """
         csv_path = Path(csv_file_path)
-        if not csv_path.exists():
-            raise FileNotFoundError(f"CSV 文件不存在: {csv_file_path}")
         
         try:
             # 读取文件基本信息
             file_size = csv_path.stat().st_size
             
-            # 读取前几行来检测信息
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                
-                # 读取前 10 行进行检测
-                rows = []
-                for i, row in enumerate(reader):
-                    if i >= 10:
-                        break
-                    rows.append(row)
+            # 单次遍历文件：以 1 MiB 字节块统计换行符（bytes.count 由 C 实现），
+            # 同时保留第一块用于检测分隔符和解析前 10 行
+            head = b""
+            line_count = 0
+            last_byte = b""
+            with open(csv_path, 'rb') as f:
+                while chunk := f.read(1 << 20):
+                    if not head:
+                        head = chunk
+                    # 与通用换行模式一致：\n、\r 和 \r\n 各算一个换行
+                    line_count += (
+                        chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n")
+                    )
+                    # 跨块边界的 \r\n 在上面被计为两个换行
+                    if last_byte == b"\r" and chunk[:1] == b"\n":
+                        line_count -= 1
+                    last_byte = chunk[-1:]
+
+            # 末行没有换行符时也算作一行
+            if last_byte and last_byte not in (b"\n", b"\r"):
+                line_count += 1
+            
+            # 根据前 64 KiB 检测分隔符
+            delimiter = _sniff_delimiter(head[:1 << 16])
+            
+            # 文件没有完整读入时丢弃末尾不完整的行；整块只有一行时保留，
+            # 由增量解码器忽略被截断的多字节字符
+            if file_size > len(head):
+                cut = max(head.rfind(b"\n"), head.rfind(b"\r"))
+                if cut >= 0:
+                    head = head[:cut + 1]
+            decode = codecs.getincrementaldecoder('utf-8')().decode
+            head_lines = [decode(line) for line in head.splitlines(keepends=True)[:10]]
+            rows = list(csv.reader(head_lines, delimiter=delimiter))
             
             if not rows:
                 return {
@@ -301,17 +690,9 @@ class CSVConverter:
                     "columns": [],
                     "sample_data": [],
                     "file_encoding": "utf-8",
-                    "detected_delimiter": ",",
+                    "detected_delimiter": delimiter,
                 }
             
-            # 检测分隔符（简化版）
-            first_line = rows[0] if rows else []
-            delimiter = "," if len(first_line) > 1 else ","
-            
-            # 估算行数（读取文件行数）
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                line_count = sum(1 for _ in f)
-            
             # 生成列名
             if len(rows) > 0:
                 headers = rows[0] if len(rows[0]) > 1 else [f"column_{i}" for i in range(len(rows[0]))]
@@ -340,5 +721,7 @@ class CSVConverter:
             
             return info
             
+        except FileNotFoundError:
+            raise
         except Exception as e:
             raise ValueError(f"获取 CSV 文件信息失败: {e}")
\ No newline at end of file
@@ -31,7 +31,9 @@ class CSV2JSONServer:
             skip_rows: int = 0,
             header: bool = True,
             orient: str = "records",
-            indent: Optional[int] = None
+            indent: Optional[int] = None,
+            parse_numbers: bool = False,
+            numeric_precision: str = "f64"
         ) -> Dict[str, Any]:
             """
             将 CSV 文件转换为 JSON 文件。
@@ -47,7 +49,14 @@ class CSV2JSONServer:
                     - "records": 每行作为一个字典对象的列表
                     - "values": 仅包含值的二维数组
                     - "split": 分开存储列名和数据的格式
-                indent: JSON 缩进，默认为 None（紧凑格式），可设置为 2 或 4 等值
+                indent: JSON 缩进，默认为 None（紧凑格式），可设置为 2 或 4 等值；
+                    None 和 2 使用 orjson 快速序列化，其他值退回较慢的标准库 json
+                parse_numbers: 是否将数值列输出为数字，默认为 False；整数列输出为 int，
+                    其余数值列输出为 float，非数值列保持字符串
+                numeric_precision: 浮点数列的输出精度，默认为 "f64"，可选值：
+                    - "f64": 保持原始精度
+                    - "f32": 按 float32 精度输出最短表示，可明显缩短 JSON
+                    - "bf16-as-f32": 先舍入到 bfloat16 精度，再以 float32 输出
                 
             Returns:
                 包含转换结果的字典，结构为：
@@ -70,11 +79,14 @@ class CSV2JSONServer:
                     skip_rows=skip_rows,
                     header=header,
                     orient=orient,
-                    indent=indent
+                    indent=indent,
+                    parse_numbers=parse_numbers,
+                    numeric_precision=numeric_precision
                 )
                 
-                # 执行转换并生成 JSON 文件
-                json_file_path = self.converter.convert_csv_to_json_file(
+                # 在线程池中执行转换并生成 JSON 文件，避免阻塞事件循环
+                json_file_path = await asyncio.to_thread(
+                    self.converter.convert_csv_to_json_file,
                     file_path, output_file_path, options
                 )
                 
@@ -110,7 +122,9 @@ class CSV2JSONServer:
             skip_rows: int = 0,
             header: bool = True,
             orient: str = "records",
-            indent: Optional[int] = None
+            indent: Optional[int] = None,
+            parse_numbers: bool = False,
+            numeric_precision: str = "f64"
         ) -> Dict[str, Any]:
             """
             将 CSV 格式的字符串转换为 JSON 格式。
@@ -126,7 +140,14 @@ class CSV2JSONServer:
                     - "index": 包含索引的字典
                     - "table": 包含 schema 和数据的完整表格格式
                     - "split": 分开存储列名和数据的格式
-                indent: JSON 缩进，默认为 None（紧凑格式），可设置为 2 或 4 等值
+                indent: JSON 缩进，默认为 None（紧凑格式），可设置为 2 或 4 等值；
+                    None 和 2 使用 orjson 快速序列化，其他值退回较慢的标准库 json
+                parse_numbers: 是否将数值列输出为数字，默认为 False；整数列输出为 int，
+                    其余数值列输出为 float，非数值列保持字符串
+                numeric_precision: 浮点数列的输出精度，默认为 "f64"，可选值：
+                    - "f64": 保持原始精度
+                    - "f32": 按 float32 精度输出最短表示，可明显缩短 JSON
+                    - "bf16-as-f32": 先舍入到 bfloat16 精度，再以 float32 输出
                 
             Returns:
                 包含转换结果的字典，结构为：
@@ -147,11 +168,15 @@ class CSV2JSONServer:
                     skip_rows=skip_rows,
                     header=header,
                     orient=orient,
-                    indent=indent
+                    indent=indent,
+                    parse_numbers=parse_numbers,
+                    numeric_precision=numeric_precision
                 )
                 
-                # 执行转换
-                json_result = self.converter.convert_csv_string_to_json(csv_content, options)
+                # 在线程池中执行转换，避免阻塞事件循环
+                json_result = await asyncio.to_thread(
+                    self.converter.convert_csv_string_to_json, csv_content, options
+                )
                 
                 return {
                     "success": True,
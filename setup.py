@@ -0,0 +1,14 @@
+"""构建可选的 C 扩展；项目元数据见 pyproject.toml."""
+
+from setuptools import Extension, setup
+
+setup(
+    ext_modules=[
+        Extension(
+            "csv2json_mcp._csv_fast",
+            sources=["csv2json_mcp/_csv_fast.c"],
+            # 编译失败时仍可安装，运行时退回 csv 模块
+            optional=True,
+        )
+    ]
+)
@@ -0,0 +1,71 @@
+"""CSVConverter 文件接口测试."""
+
+import json
+
+import pytest
+
+from csv2json_mcp.converter import CSVConversionOptions, CSVConverter
+
+
+def test_crlf_inside_quoted_field_is_preserved(tmp_path):
+    """文件以 newline='' 打开，引号内的 \\r\\n 原样保留，不再被转换为 \\n."""
+    src = tmp_path / "data.csv"
+    src.write_bytes(b'a,b\r\n"x\r\ny",1\r\n"p\nq",2\r\n')
+
+    result = json.loads(CSVConverter().convert_csv_to_json(src))
+    assert result == [{"a": "x\r\ny", "b": "1"}, {"a": "p\nq", "b": "2"}]
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_failed_conversion_keeps_existing_output(tmp_path, indent):
+    """转换中途出错时不留下截断的 JSON，原输出文件保持不变."""
+    src = tmp_path / "data.csv"
+    src.write_bytes(b"a,b\n" + b"x,y\n" * 100000 + b"\xff,1\n")
+    out = tmp_path / "data.json"
+    out.write_text("old", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        CSVConverter().convert_csv_to_json_file(src, out, CSVConversionOptions(indent=indent))
+
+    assert out.read_text(encoding="utf-8") == "old"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["data.csv", "data.json"]
+
+
+def test_conversion_replaces_existing_output(tmp_path):
+    src = tmp_path / "data.csv"
+    src.write_text("a,b\n1,2\n", encoding="utf-8")
+    out = tmp_path / "data.json"
+    out.write_text("old", encoding="utf-8")
+
+    assert CSVConverter().convert_csv_to_json_file(src, out) == str(out)
+    assert json.loads(out.read_text(encoding="utf-8")) == [{"a": "1", "b": "2"}]
+
+
+def test_missing_output_directory_names_output_path(tmp_path):
+    """输出目录不存在时报告转换失败和目标路径，不暴露内部临时文件."""
+    src = tmp_path / "data.csv"
+    src.write_text("a,b\n1,2\n", encoding="utf-8")
+    out = tmp_path / "missing" / "data.json"
+
+    with pytest.raises(ValueError, match="转换失败") as excinfo:
+        CSVConverter().convert_csv_to_json_file(src, out)
+
+    assert str(out) in str(excinfo.value)
+    assert ".tmp" not in str(excinfo.value)
+
+
+def test_output_keeps_permissions_and_symlink(tmp_path):
+    """替换输出文件时保留原权限位，符号链接仍指向被更新的文件."""
+    src = tmp_path / "data.csv"
+    src.write_text("a,b\n1,2\n", encoding="utf-8")
+    real = tmp_path / "real.json"
+    real.write_text("old", encoding="utf-8")
+    real.chmod(0o640)
+    link = tmp_path / "link.json"
+    link.symlink_to(real)
+
+    CSVConverter().convert_csv_to_json_file(src, link)
+
+    assert link.is_symlink()
+    assert json.loads(real.read_text(encoding="utf-8")) == [{"a": "1", "b": "2"}]
+    assert real.stat().st_mode & 0o777 == 0o640
@@ -0,0 +1,91 @@
+"""C 扩展 _csv_fast 测试：解析结果必须与 csv.reader 一致."""
+
+import csv
+import io
+import random
+
+import pytest
+
+from csv2json_mcp import converter
+
+_csv_fast = pytest.importorskip("csv2json_mcp._csv_fast")
+
+ALPHABET = ["a", "b", ",", ";", '"', "\r", "\n", " ", "é", "中", '""']
+
+
+class _ShortReads(io.BytesIO):
+    """每次 read 至多返回固定字节数，用于覆盖记录跨块的情况."""
+
+    def __init__(self, data: bytes, sizes):
+        super().__init__(data)
+        self._sizes = sizes
+        self._calls = 0
+
+    def read(self, size=-1):
+        limit = self._sizes[self._calls % len(self._sizes)]
+        self._calls += 1
+        return super().read(limit if size < 0 else min(size, limit))
+
+
+def _reference(text: str, delimiter: str):
+    return list(csv.reader(io.StringIO(text, newline=""), delimiter=delimiter))
+
+
+def _fast(data: bytes, delimiter: str, sizes=None):
+    fp = _ShortReads(data, sizes) if sizes else io.BytesIO(data)
+    return list(converter._iter_csv_fast_rows(fp, delimiter))
+
+
+def test_matches_csv_reader_on_random_input():
+    """随机输入的差分测试，整块读取与小块读取都要与 csv.reader 一致."""
+    rng = random.Random(0)
+    compared = 0
+    for _ in range(60000):
+        text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 30)))
+        delimiter = rng.choice(",;")
+        try:
+            expected = _reference(text, delimiter)
+        except csv.Error:
+            continue
+        data = text.encode("utf-8")
+        sizes = [rng.randint(1, 5) for _ in range(3)]
+        assert _fast(data, delimiter) == expected, text
+        assert _fast(data, delimiter, sizes) == expected, (text, sizes)
+        compared += 1
+    assert compared > 50000
+
+
+def test_many_rows_across_batches():
+    text = "".join(f'{i},"x{i}\n,y"\r\n' for i in range(10000))
+    data = text.encode("utf-8")
+    assert _fast(data, ",") == _reference(text, ",")
+    assert _fast(data, ",", [4096]) == _reference(text, ",")
+
+
+@pytest.mark.parametrize("field", ["a" * 200, "中" * 200, '"' + "b" * 200 + '"'])
+def test_field_size_limit(field):
+    """超过 csv.field_size_limit 的字段与 csv.reader 一样抛出 csv.Error."""
+    old = csv.field_size_limit(150)
+    try:
+        text = f"x,{field}\n"
+        with pytest.raises(csv.Error, match="field larger than field limit"):
+            _reference(text, ",")
+        with pytest.raises(csv.Error, match="field larger than field limit"):
+            _fast(text.encode("utf-8"), ",", [64])
+    finally:
+        csv.field_size_limit(old)
+
+
+def test_limit_counts_characters_not_bytes():
+    """字节数超过限制但字符数未超过时不报错."""
+    old = csv.field_size_limit(150)
+    try:
+        text = "x," + "中" * 100 + "\n"
+        assert _fast(text.encode("utf-8"), ",") == _reference(text, ",")
+    finally:
+        csv.field_size_limit(old)
+
+
+def test_invalid_utf8_raises():
+    with pytest.raises(UnicodeDecodeError):
+        _fast(b"a,b\n\xff,1\n", ",")
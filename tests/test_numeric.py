@@ -0,0 +1,148 @@
+"""数值快速路径测试：numba 内核的结果必须与纯 Python 路径一致."""
+
+import json
+import random
+import sys
+
+import pytest
+
+from csv2json_mcp import _numeric
+from csv2json_mcp.converter import CSVConversionOptions, CSVConverter
+
+needs_kernels = pytest.mark.skipif(
+    _numeric.load_kernels() is None, reason="需要安装 numpy 与 numba"
+)
+
+
+def _random_numeric_csv(rows: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+
+    def cell() -> str:
+        return rng.choice([
+            str(rng.randint(-1000, 100000)),
+            f"{rng.uniform(-1e6, 1e6):.{rng.randint(1, 6)}f}",
+            "0.1",
+            "-0",
+        ])
+
+    lines = ["a,b,c"] + [",".join(cell() for _ in range(3)) for _ in range(rows)]
+    return "\n".join(lines) + "\n"
+
+
+CASES = {
+    "random": _random_numeric_csv(500),
+    "all_int": "a,b\n1,2\n3,4\n",
+    "all_float": "a,b\n1.5,2.25\n3.1,0.1\n",
+    "mixed_types": "a,b\n1,2.5\n3,4.0\n",
+    "crlf_no_eol": "a,b\r\n1,2\r\n3.5,-4",
+    "ragged": "a,b\n1,2\n3\n",
+    "blank_line": "a,b\n1,2\n\n3,4\n",
+    "late_text": "a,b\n" + "1,2\n" * 150 + "x,3\n",
+    "string_column": "a,b,c\n1,2.5,x\n-3,4,y\n",
+    "long_digits": "a\n12345678901234567890\n",
+    "no_data": "a,b\n",
+    "cr_only": "a,b\r1,2\r3,4\r",
+    "quoted_skip": '"note\n1"\n5\n1\n2\n',
+}
+
+
+def _write(tmp_path, text: str):
+    path = tmp_path / "data.csv"
+    path.write_text(text, encoding="utf-8", newline="")
+    return path
+
+
+@pytest.mark.parametrize("name", sorted(CASES))
+@pytest.mark.parametrize("orient", ["records", "values", "split"])
+@pytest.mark.parametrize("header", [True, False])
+@pytest.mark.parametrize("skip_rows", [0, 1])
+def test_fast_path_matches_standard_path(
+    tmp_path, monkeypatch, name, orient, header, skip_rows
+):
+    """快速路径只能回退，不能改变结果：与禁用快速路径时的文件转换输出相同."""
+    path = _write(tmp_path, CASES[name])
+    converter = CSVConverter()
+    options = CSVConversionOptions(
+        orient=orient, header=header, skip_rows=skip_rows, parse_numbers=True
+    )
+
+    got = json.loads(converter.convert_csv_to_json(path, options))
+    monkeypatch.setattr(CSVConverter, "_numeric_fast_path", lambda self, path, options: None)
+    expected = json.loads(converter.convert_csv_to_json(path, options))
+    assert got == expected
+
+
+@needs_kernels
+@pytest.mark.parametrize("name", ["random", "all_int", "all_float", "mixed_types", "crlf_no_eol"])
+def test_fast_path_taken_for_numeric_files(tmp_path, name):
+    path = _write(tmp_path, CASES[name])
+    options = CSVConversionOptions(orient="values", parse_numbers=True)
+    assert CSVConverter()._numeric_fast_path(path, options) is not None
+
+
+@needs_kernels
+@pytest.mark.parametrize("name", ["ragged", "blank_line", "late_text", "string_column", "long_digits"])
+def test_fast_path_falls_back(tmp_path, name):
+    """内核拒绝的输入返回 None，由纯 Python 路径处理."""
+    path = _write(tmp_path, CASES[name])
+    options = CSVConversionOptions(orient="values", parse_numbers=True)
+    assert CSVConverter()._numeric_fast_path(path, options) is None
+
+
+def test_sample_gate_rejects_text(tmp_path):
+    """抽样发现非数值单元格时不调用内核."""
+    path = _write(tmp_path, "a,b\nx,1\n")
+    options = CSVConversionOptions(parse_numbers=True)
+    assert CSVConverter()._numeric_fast_path(path, options) is None
+
+
+def test_fast_path_disabled_without_parse_numbers(tmp_path):
+    path = _write(tmp_path, CASES["all_int"])
+    assert CSVConverter()._numeric_fast_path(path, CSVConversionOptions()) is None
+
+
+def test_long_integer_column_stays_string():
+    """超过 18 位的整数列保持字符串，不转换为有损的 float."""
+    text = "id,n\n12345678901234567890,1\n2,2\n"
+    options = CSVConversionOptions(parse_numbers=True)
+    result = json.loads(CSVConverter().convert_csv_string_to_json(text, options))
+    assert result == [{"id": "12345678901234567890", "n": 1}, {"id": "2", "n": 2}]
+
+
+@pytest.mark.parametrize("precision", ["f32", "bf16-as-f32"])
+@pytest.mark.parametrize("indent", [None, 4])
+def test_float32_overflow_keeps_f64(precision, indent):
+    """超出 float32 范围的列保持 f64，输出仍是合法 JSON."""
+    pytest.importorskip("numpy")
+    big = "1" + "0" * 39 + ".5"
+    text = f"a,b\n{big},1.5\n2.5,2.5\n"
+    options = CSVConversionOptions(
+        orient="values", indent=indent, parse_numbers=True, numeric_precision=precision
+    )
+    output = CSVConverter().convert_csv_string_to_json(text, options)
+    assert "Infinity" not in output and "null" not in output
+    assert json.loads(output) == [[float(big), 1.5], [2.5, 2.5]]
+
+
+def test_records_infer_types_from_kept_rows():
+    """records 丢弃的行不参与类型推断."""
+    text = "a,b\n1,2\nx\n3,4"
+    options = CSVConversionOptions(parse_numbers=True)
+    result = json.loads(CSVConverter().convert_csv_string_to_json(text, options))
+    assert result == [{"a": 1, "b": 2}, {"a": 3, "b": 4}]
+
+
+def test_precision_without_numba(monkeypatch):
+    """只安装 numpy 时降精度输出仍可用，仅快速路径被禁用."""
+    pytest.importorskip("numpy")
+    monkeypatch.setitem(sys.modules, "numba", None)
+    _numeric.load_kernels.cache_clear()
+    try:
+        assert _numeric.load_kernels() is None
+        options = CSVConversionOptions(
+            orient="values", parse_numbers=True, numeric_precision="f32"
+        )
+        result = json.loads(CSVConverter().convert_csv_string_to_json("a\n0.1\n", options))
+        assert result == [[0.1]]
+    finally:
+        _numeric.load_kernels.cache_clear()